@@ -124,6 +124,7 @@ classes = (
     # Material Layers
     material_layers.MATLAYER_layer_stack,
     material_layers.MATLAYER_layers,
+    material_layers.MATLAYER_scene_layer_properties,
     material_layers.MATLAYER_OT_add_material_layer,
     material_layers.MATLAYER_OT_add_decal_material_layer,
     material_layers.MATLAYER_OT_add_image_layer,
@@ -133,6 +134,7 @@ classes = (
     material_layers.MATLAYER_OT_move_material_layer_down,
     material_layers.MATLAYER_OT_toggle_material_channel_preview,
     material_layers.MATLAYER_OT_toggle_hide_layer,
+    material_layers.MATLAYER_OT_toggle_layer_material_channel,
     material_layers.MATLAYER_OT_set_layer_projection_uv,
     material_layers.MATLAYER_OT_set_layer_projection_triplanar,
     material_layers.MATLAYER_OT_change_material_channel_value_node,
@@ -252,7 +254,7 @@ def depsgraph_change_handler(scene, depsgraph):
             # Search for an relink any unlinked material channels that occur as a result of this change.
             shader_info = bpy.context.scene.matlayer_shader_info
             for channel in shader_info.material_channels:
-                selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+                selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
                 value_node = material_layers.get_material_layer_node('VALUE', selected_layer_index, channel.name)
                 if value_node:
                     if len(value_node.outputs) > 0:
@@ -318,6 +320,21 @@ def load_handler(dummy):
     if shader_info.shader_node_group == None:
         shaders.set_shader('MetallicRoughnessPBR')
 
+    # Layer stack properties were previously stored in their own scene property, read the selected material channel from blend files saved with that layout.
+    layer_stack = bpy.context.scene.matlayer.layer_stack
+    channel_names = [channel.name for channel in shader_info.material_channels]
+    if layer_stack.selected_material_channel not in channel_names:
+        legacy_layer_stack = bpy.context.scene.get('matlayer_layer_stack')
+        legacy_selected_material_channel = None
+        if legacy_layer_stack:
+            legacy_selected_material_channel = legacy_layer_stack.get('selected_material_channel')
+
+        # Reset the selected material channel to the first shader channel if it's not valid for the shader.
+        if legacy_selected_material_channel in channel_names:
+            layer_stack.selected_material_channel = legacy_selected_material_channel
+        elif len(channel_names) > 0:
+            layer_stack.selected_material_channel = channel_names[0]
+
 def register():
     # Register properties, operators and pannels.
     for cls in classes:
@@ -336,8 +353,7 @@ def register():
     bpy.types.Scene.matlayer_selected_global_shader_property_index = IntProperty()
 
     # Layer & Mask Properties
-    bpy.types.Scene.matlayer_layer_stack = PointerProperty(type=material_layers.MATLAYER_layer_stack)
-    bpy.types.Scene.matlayer_layers = CollectionProperty(type=material_layers.MATLAYER_layers)
+    bpy.types.Scene.matlayer = PointerProperty(type=material_layers.MATLAYER_scene_layer_properties)
     bpy.types.Scene.matlayer_mask_stack = PointerProperty(type=MATLAYER_mask_stack)
     bpy.types.Scene.matlayer_masks = CollectionProperty(type=MATLAYER_masks)
 
@@ -270,17 +270,18 @@ def create_image(new_image_name, image_width=-1, image_height=-1, base_color=(0.
     else:
         h = image_height
 
-    bpy.ops.image.new(name=new_image_name, 
-                      width=w, 
-                      height=h,
-                      color=base_color, 
-                      alpha=alpha_channel, 
-                      generated_type=generate_type,
-                      float=thirty_two_bit,
-                      use_stereo_3d=False, 
-                      tiled=False)
-
-    return bpy.data.images.get(new_image_name)
+    # Create the image directly in blend data, this avoids the overhead of running an operator.
+    new_image = bpy.data.images.new(name=new_image_name,
+                                    width=w,
+                                    height=h,
+                                    alpha=alpha_channel,
+                                    float_buffer=thirty_two_bit,
+                                    stereo3d=False,
+                                    tiled=False)
+    new_image.generated_type = generate_type
+    new_image.generated_color = base_color
+
+    return new_image
     
 def create_data_image(image_name, image_width, image_height, alpha_channel=False, thirty_two_bit=False, data=False, delete_existing=True):
     '''Creates a new data based image in the blend file.'''
@@ -9,7 +9,7 @@ from ..core import debug_logging
 
 def update_selected_mask_index(self, context):
     '''Updates properties when the selected mask slot is changed.'''
-    selected_layer_index = context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = context.scene.matlayer.layer_stack.selected_layer_index
     selected_mask_index = context.scene.matlayer_mask_stack.selected_index
     mask_texture_node = get_mask_node('TEXTURE', selected_layer_index, selected_mask_index)
     if mask_texture_node:
@@ -235,7 +235,7 @@ def add_layer_mask(type, self):
     if blender_addon_utils.verify_material_operation_context(self) == False:
         return
 
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     new_mask_slot_index = add_mask_slot()
     active_material = bpy.context.active_object.active_material
 
@@ -267,21 +267,21 @@ def add_layer_mask(type, self):
             image_name = "Mask_" + str(random.randrange(10000,99999))
             while bpy.data.images.get(image_name) != None:
                 image_name = "Mask_" + str(random.randrange(10000,99999))
-            bpy.ops.image.new(name=image_name, 
-                              width=tss.get_texture_width(), 
-                              height=tss.get_texture_height(), 
-                              color=(0.0, 0.0, 0.0, 1.0), 
-                              alpha=False, generated_type='BLANK', 
-                              float=True, 
-                              use_stereo_3d=False, 
-                              tiled=False)
+            new_image = blender_addon_utils.create_image(
+                new_image_name=image_name,
+                image_width=tss.get_texture_width(),
+                image_height=tss.get_texture_height(),
+                base_color=(0.0, 0.0, 0.0, 1.0),
+                generate_type='BLANK',
+                alpha_channel=False,
+                thirty_two_bit=True
+            )
             
             reindex_masks('ADDED_MASK', selected_layer_index, new_mask_slot_index)
             organize_mask_nodes()
             link_mask_nodes(selected_layer_index)
 
             texture_node = get_mask_node('TEXTURE', selected_layer_index, new_mask_slot_index)
-            new_image = bpy.data.images.get(image_name)
             if texture_node and new_image:
                 texture_node.image = new_image
 
@@ -300,21 +300,21 @@ def add_layer_mask(type, self):
             image_name = "Mask_" + str(random.randrange(10000,99999))
             while bpy.data.images.get(image_name) != None:
                 image_name = "Mask_" + str(random.randrange(10000,99999))
-            bpy.ops.image.new(name=image_name, 
-                              width=tss.get_texture_width(), 
-                              height=tss.get_texture_height(), 
-                              color=(1.0, 1.0, 1.0, 1.0), 
-                              alpha=False, generated_type='BLANK', 
-                              float=True, 
-                              use_stereo_3d=False, 
-                              tiled=False)
+            new_image = blender_addon_utils.create_image(
+                new_image_name=image_name,
+                image_width=tss.get_texture_width(),
+                image_height=tss.get_texture_height(),
+                base_color=(1.0, 1.0, 1.0, 1.0),
+                generate_type='BLANK',
+                alpha_channel=False,
+                thirty_two_bit=True
+            )
             
             reindex_masks('ADDED_MASK', selected_layer_index, new_mask_slot_index)
             organize_mask_nodes()
             link_mask_nodes(selected_layer_index)
 
             texture_node = get_mask_node('TEXTURE', selected_layer_index, new_mask_slot_index)
-            new_image = bpy.data.images.get(image_name)
             if texture_node and new_image:
                 texture_node.image = new_image
 
@@ -440,7 +440,7 @@ def duplicate_mask(self, mask_index=-1):
 
     # Duplicate the mask node, mask node tree and add it to the mask stack.
     active_material = bpy.context.active_object.active_material
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     mask_node = get_mask_node('MASK', selected_layer_index, mask_index)
     mask_node_tree = get_mask_node_tree(selected_layer_index, mask_index)
     if mask_node_tree:
@@ -467,7 +467,7 @@ def delete_layer_mask(self):
         return
 
     masks = bpy.context.scene.matlayer_masks
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     selected_mask_index = bpy.context.scene.matlayer_mask_stack.selected_index
     active_material = bpy.context.active_object.active_material
 
@@ -494,7 +494,7 @@ def move_mask(direction, self):
         return
 
     masks = bpy.context.scene.matlayer_masks
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
 
     match direction:
         case 'UP':
@@ -576,6 +576,8 @@ def organize_mask_nodes():
     layer_count = material_layers.count_layers()
     for i in range(0, layer_count):
         layer_node = material_layers.get_material_layer_node('LAYER', i)
+        if not layer_node:
+            continue
         position_y = layer_node.location[1] - 1250
         mask_count = count_masks(i)
         for c in range(mask_count, 0, -1):
@@ -627,7 +629,7 @@ def refresh_mask_slots():
     active_object = bpy.context.active_object
     if active_object:
         masks = bpy.context.scene.matlayer_masks
-        selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+        selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
         masks.clear()
         mask_count = count_masks(selected_layer_index)
         for i in range(0, mask_count):
@@ -646,7 +648,7 @@ def refresh_mask_slots():
 
 def relink_image_mask_projection(original_output_channel):
     '''Relinks projection nodes based on the projection mode for image masks.'''
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     selected_mask_index = bpy.context.scene.matlayer_mask_stack.selected_index
     mask_node = get_mask_node('MASK', selected_layer_index, selected_mask_index)
     projection_node = get_mask_node('PROJECTION', selected_layer_index, selected_mask_index)
@@ -739,7 +741,7 @@ def relink_image_mask_projection(original_output_channel):
 
 def set_mask_projection_mode(projection_mode):
     '''Sets the projection mode of the mask. Only image masks can have their projection mode swapped.'''
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     selected_mask_index = bpy.context.scene.matlayer_mask_stack.selected_index
 
     original_output_channel = get_mask_output_channel()
@@ -817,7 +819,7 @@ def set_mask_projection_mode(projection_mode):
                     blur_node.node_tree = blender_addon_utils.append_group_node('ML_TriplanarBlur')
 
 def get_mask_output_channel():
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     selected_mask_index = bpy.context.scene.matlayer_mask_stack.selected_index
     filter_node = get_mask_node('FILTER', selected_layer_index, selected_mask_index)
 
@@ -830,7 +832,7 @@ def get_mask_output_channel():
     return output_channel
 
 def set_mask_output_channel(output_channel):
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     selected_mask_index = bpy.context.scene.matlayer_mask_stack.selected_index
 
     mask_node = get_mask_node('MASK', selected_layer_index, selected_mask_index)
@@ -916,7 +918,7 @@ class MATLAYER_UL_mask_list(bpy.types.UIList):
             operator.mask_index = item_index
 
             # Mask Name
-            selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+            selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
             mask_node = get_mask_node('MASK', selected_layer_index, item_index)
             if mask_node:
                 row = layout.row()
@@ -1228,7 +1230,7 @@ class MATLAYER_OT_isolate_mask(Operator):
         if blender_addon_utils.verify_material_operation_context(self) == False:
             return
 
-        selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+        selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
         selected_mask_index = bpy.context.scene.matlayer_mask_stack.selected_index
         active_node_tree = bpy.context.active_object.active_material.node_tree
 
@@ -1260,7 +1262,7 @@ class MATLAYER_OT_toggle_mask_blur(Operator):
             return
         
         # Toggle the blur node active state.
-        selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+        selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
         selected_mask_index = bpy.context.scene.matlayer_mask_stack.selected_index
         blur_node = get_mask_node('BLUR', selected_layer_index, selected_mask_index)
         if blur_node:
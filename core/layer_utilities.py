@@ -263,7 +263,7 @@ class MATLAYER_OT_import_texture_set(Operator, ImportHelper):
                 # Change all material channels to use texture nodes (if they aren't already).
                 for packed_channel in packed_channels:
                     channel = packed_channel[0]
-                    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+                    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
                     value_node = material_layers.get_material_layer_node('VALUE', selected_layer_index, channel)
                     if value_node.bl_static_type != 'TEX_IMAGE':
                         material_layers.replace_material_channel_node(channel, 'TEXTURE')
@@ -340,16 +340,13 @@ class MATLAYER_OT_merge_materials(Operator):
                             if duplicated_node_tree:
                                 new_layer_slot_index = material_layers.add_material_layer_slot()
 
-                                duplicated_node_tree.name = "{0}_{1}".format(active_material.name, str(new_layer_slot_index))
+                                duplicated_node_tree.name = material_layers.format_layer_group_node_name(active_material.name, new_layer_slot_index)
                                 new_layer_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
                                 new_layer_group_node.node_tree = duplicated_node_tree
                                 new_layer_group_node.name = str(new_layer_slot_index) + "~"
                                 new_layer_group_node.label = merge_layer_node.label
                                 
                                 material_layers.reindex_layer_nodes(change_made='ADDED_LAYER', affected_layer_index=new_layer_slot_index)
-                                material_layers.organize_layer_group_nodes()
-                                material_layers.link_layer_group_nodes(self)
-                                layer_masks.organize_mask_nodes()
 
                         # Clear the mask stack from the new layer.
                         masks = bpy.context.scene.matlayer_masks
@@ -373,7 +370,12 @@ class MATLAYER_OT_merge_materials(Operator):
                                     layer_masks.reindex_masks('ADDED_MASK', new_layer_slot_index, affected_mask_index=i)
 
                         layer_masks.link_mask_nodes(new_layer_slot_index)
-                        layer_masks.organize_mask_nodes()
+
+                # Organize and link all layers once after merging, rather than after each merged layer.
+                active_layer_count = material_layers.count_layers()
+                material_layers.organize_layer_group_nodes(active_layer_count)
+                material_layers.link_layer_group_nodes(self, active_layer_count)
+                layer_masks.organize_mask_nodes()
 
             bpy.context.scene.matlayer_merge_material = None
             debug_logging.log_status("Merged materials.", self, type='INFO')
@@ -2,15 +2,16 @@
 
 import bpy
 from bpy.types import PropertyGroup, Operator
-from bpy.props import IntProperty, StringProperty
+from bpy.props import IntProperty, StringProperty, CollectionProperty, PointerProperty
 from ..core import layer_masks
 from ..core import mesh_map_baking
 from ..core import blender_addon_utils as bau
 from ..core import debug_logging
 from ..core import texture_set_settings as tss
 from ..core import shaders
+from .. import preferences
 import copy
-import random
+import functools
 
 TRIPLANAR_PROJECTION_INPUTS = [
     'LeftRight',
@@ -24,6 +25,33 @@ TRIPLANAR_PROJECTION_INPUTS = [
     'SignedGeometryNormals'
 ]
 
+# Node name formats for nodes within layer group nodes, accessed through get_material_layer_node.
+# {0} is replaced with the static material channel name, {1} is replaced with the node number.
+LAYER_GROUP_NODE_NAMES = {
+    'PROJECTION': "PROJECTION",
+    'TRIPLANAR_BLEND': "TRIPLANAR_BLEND_{0}",
+    'FIX_NORMAL_ROTATION': "FIX_NORMAL_ROTATION",
+    'MIX_IMAGE_ALPHA': "MIX_{0}_IMAGE_ALPHA",
+    'BLUR': "BLUR",
+    'MIX': "{0}_MIX",
+    'MIX_REROUTE': "{0}_MIX_REROUTE",
+    'OPACITY': "{0}_OPACITY",
+    'VALUE': "{0}_VALUE_{1}",
+    'FILTER': "{0}_FILTER",
+    'DECAL_COORDINATES': "DECAL_COORDINATES",
+    'LINEAR_DECAL_MASK_BLEND': "LINEAR_DECAL_MASK_BLEND",
+    'SEPARATE_RGBA': "SEPARATE_{0}",
+    'GROUP_INPUT': "GROUP_INPUT",
+    'GROUP_OUTPUT': "GROUP_OUTPUT"
+}
+
+# Functions that return nodes that exist directly in the material node tree (outside of layer group nodes), accessed through get_material_layer_node.
+MATERIAL_NODE_GETTERS = {
+    'LAYER': lambda active_material, layer_index, get_changed: active_material.node_tree.nodes.get(str(layer_index) + "~" if get_changed else str(layer_index)),
+    'MATERIAL_OUTPUT': lambda active_material, layer_index, get_changed: active_material.node_tree.nodes.get('MATERIAL_OUTPUT'),
+    'EXPORT_UV_MAP': lambda active_material, layer_index, get_changed: active_material.node_tree.nodes.get('EXPORT_UV_MAP')
+}
+
 
 #----------------------------- UPDATING PROPERTIES -----------------------------#
 
@@ -40,8 +68,8 @@ def update_layer_index(self, context):
     layer_masks.refresh_mask_slots()
 
     # Select the image for texture painting.
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
-    selected_material_channel = bpy.context.scene.matlayer_layer_stack.selected_material_channel
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
+    selected_material_channel = bpy.context.scene.matlayer.layer_stack.selected_material_channel
     value_node = get_material_layer_node('VALUE', selected_layer_index, selected_material_channel)
     if value_node:
         if value_node.bl_static_type == 'TEX_IMAGE':
@@ -52,7 +80,7 @@ def update_layer_index(self, context):
         if active_object.active_material:
 
             # Hide all decal objects excluding the one for this layer (if this layer is a decal layer).
-            material_layers = bpy.context.scene.matlayer_layers
+            material_layers = bpy.context.scene.matlayer.layers
             for i in range(0, len(material_layers)):
                 decal_coordinates_node = get_material_layer_node('DECAL_COORDINATES', i)
                 if decal_coordinates_node:
@@ -68,7 +96,7 @@ def sync_triplanar_settings():
         return
 
     # Sync triplanar texture samples for all material channels.
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     projection_node = get_material_layer_node('PROJECTION', selected_layer_index)
     if projection_node:
         if projection_node.node_tree.name == 'ML_TriplanarProjection':
@@ -191,10 +219,20 @@ def parse_material_name(layer_group_node_name):
             return material_name
     return -1
 
+@functools.lru_cache(maxsize=256)
 def format_layer_group_node_name(material_name, layer_index):
     '''Properly formats the layer group node names for this add-on.'''
+    # Results are cached because this is called many times per user interface redraw, the formatted name only depends on the arguments so the cache never needs to be cleared.
     return "{0}_{1}".format(material_name, layer_index)
 
+@functools.lru_cache(maxsize=512)
+def format_layer_node_name(layer_node_name, channel_name, node_number=1):
+    '''Returns the name of a node within a layer group node. Returns None for invalid layer node names.'''
+    node_name_format = LAYER_GROUP_NODE_NAMES.get(layer_node_name)
+    if node_name_format == None:
+        return None
+    return node_name_format.format(bau.format_static_channel_name(channel_name), node_number)
+
 def get_layer_node_tree(layer_index):
     '''Returns the node group for the specified layer (from Blender data) if it exists'''
     
@@ -227,151 +265,53 @@ def get_material_layer_node(layer_node_name, layer_index=0, channel_name='COLOR'
     if active_material == None:
         return
     
-    layer_group_node_name = format_layer_group_node_name(active_material.name, layer_index)
-    static_channel_name = bau.format_static_channel_name(channel_name)
-
-    match layer_node_name:
-        case 'LAYER':
-            if get_changed:
-                return active_material.node_tree.nodes.get(str(layer_index) + "~")
-            else:
-                return active_material.node_tree.nodes.get(str(layer_index))
-        
-        case 'MATERIAL_OUTPUT':
-            return active_material.node_tree.nodes.get('MATERIAL_OUTPUT')
-        
-        case 'PROJECTION':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("PROJECTION")
-            return None
-        
-        case 'TRIPLANAR_BLEND':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("TRIPLANAR_BLEND_{0}".format(static_channel_name))
-            return None
-
-        case 'FIX_NORMAL_ROTATION':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("FIX_NORMAL_ROTATION")
-            return None      
-
-        case 'MIX_IMAGE_ALPHA':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("MIX_{0}_IMAGE_ALPHA".format(static_channel_name))
-            return None  
-
-        case 'BLUR':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("BLUR")
-            return None
+    material_node_getter = MATERIAL_NODE_GETTERS.get(layer_node_name)
+    if material_node_getter:
+        return material_node_getter(active_material, layer_index, get_changed)
+
+    # All other nodes exist within the layer group node.
+    layer_node_name_in_group = format_layer_node_name(layer_node_name, channel_name, node_number)
+    if layer_node_name_in_group == None:
+        debug_logging.log("Invalid material node name passed to get_material_layer_node.")
+        return None
 
-        case 'MIX':
-            mix_node_name = "{0}_MIX".format(static_channel_name)
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get(mix_node_name)
-            return None
-        
-        case 'MIX_REROUTE':
-            reroute_node_name = "{0}_MIX_REROUTE".format(static_channel_name)
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get(reroute_node_name)
-            return None
-        
-        case 'OPACITY':
-            opacity_node_name = "{0}_OPACITY".format(static_channel_name)
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get(opacity_node_name)
-            return None
-        
-        case 'VALUE':
-            value_node_name = "{0}_VALUE_{1}".format(static_channel_name, node_number)
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get(value_node_name)
-            return None
-        
-        case 'FILTER':
-            filter_node_name = "{0}_FILTER".format(static_channel_name)
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get(filter_node_name)
-            return None
-
-        case 'DECAL_COORDINATES':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('DECAL_COORDINATES')
-            return None
-        
-        case 'LINEAR_DECAL_MASK_BLEND':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get('LINEAR_DECAL_MASK_BLEND')
-            return None
-        
-        case 'SEPARATE_RGBA':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("SEPARATE_{0}".format(static_channel_name))
-            return None
-        
-        case 'GROUP_INPUT':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("GROUP_INPUT")
-            return None
-        
-        case 'GROUP_OUTPUT':
-            node_tree = bpy.data.node_groups.get(layer_group_node_name)
-            if node_tree:
-                return node_tree.nodes.get("GROUP_OUTPUT")
-            return None
-        
-        case 'EXPORT_UV_MAP':
-            return active_material.node_tree.nodes.get('EXPORT_UV_MAP')
-        
-        case _:
-            debug_logging.log("Invalid material node name passed to get_material_layer_node.")
-            return None
+    node_tree = bpy.data.node_groups.get(format_layer_group_node_name(active_material.name, layer_index))
+    if node_tree:
+        return node_tree.nodes.get(layer_node_name_in_group)
+    return None
 
 def add_material_layer_slot():
     '''Adds a new slot to the material layer stack, and returns the index of the new layer slot.'''
-    layers = bpy.context.scene.matlayer_layers
-    layer_stack = bpy.context.scene.matlayer_layer_stack
+    scene = bpy.context.scene
+    layers = scene.matlayer.layers
+    layer_stack = scene.matlayer.layer_stack
+    selected_layer_index = layer_stack.selected_layer_index
 
     layer_slot = layers.add()
 
-    # Assign a random, unique number to the layer slot. This allows the layer slot array index to be found using the name of the layer slot as a key.
-    unique_random_slot_id = str(random.randrange(0, 999999))
-    while layers.find(unique_random_slot_id) != -1:
-        unique_random_slot_id = str(random.randrange(0, 999999))
-    layer_slot.name = unique_random_slot_id
+    # Assign a unique number to the layer slot. This allows the layer slot array index to be found using the name of the layer slot as a key.
+    # Slot ids are read from an increasing counter so they are always unique without searching existing layer slots.
+    unique_slot_id = layer_stack.next_slot_id
+    layer_stack.next_slot_id = unique_slot_id + 1
+    layer_slot.name = str(unique_slot_id)
 
     # If there is no layer selected, move the layer to the top of the stack.
-    if bpy.context.scene.matlayer_layer_stack.selected_layer_index < 0:
-        move_index = len(layers) - 1
+    layer_count = len(layers)
+    move_index = layer_count - 1
+    if selected_layer_index < 0:
         move_to_index = 0
         layers.move(move_index, move_to_index)
-        layer_stack.layer_index = move_to_index
-        bpy.context.scene.matlayer_layer_stack.selected_layer_index = len(layers) - 1
+        selected_layer_index = layer_count - 1
 
     # Moves the new layer above the currently selected layer and selects it.
     else: 
-        move_index = len(layers) - 1
-        move_to_index = max(0, min(bpy.context.scene.matlayer_layer_stack.selected_layer_index + 1, len(layers) - 1))
+        move_to_index = max(0, min(selected_layer_index + 1, layer_count - 1))
         layers.move(move_index, move_to_index)
-        layer_stack.layer_index = move_to_index
-        bpy.context.scene.matlayer_layer_stack.selected_layer_index = max(0, min(bpy.context.scene.matlayer_layer_stack.selected_layer_index + 1, len(layers) - 1))
+        selected_layer_index = move_to_index
 
-    return bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    # Write the selected layer index once, setting it triggers updates for the selected layer.
+    layer_stack.selected_layer_index = selected_layer_index
+    return selected_layer_index
 
 def create_default_material_setup(self):
     '''Creates a default material setup using the selected shader group node defined in the add-on shader tab.'''
@@ -424,7 +364,60 @@ def create_default_material_setup(self):
 
     return blank_material
 
+def get_default_layer_template_signature():
+    '''Returns a string describing the shader settings used to build default layer node groups. Default layer templates are rebuilt when this changes.'''
+    shader_info = bpy.context.scene.matlayer_shader_info
+    shader_node_group_name = ""
+    if shader_info.shader_node_group:
+        shader_node_group_name = shader_info.shader_node_group.name
+
+    channel_signatures = []
+    for channel in shader_info.material_channels:
+        channel_signatures.append((
+            channel.name,
+            channel.socket_type,
+            channel.socket_subtype,
+            round(channel.socket_float_default, 6),
+            round(channel.socket_float_min, 6),
+            round(channel.socket_float_max, 6),
+            tuple(round(value, 6) for value in channel.socket_color_default),
+            tuple(round(value, 6) for value in channel.socket_vector_default),
+            channel.default_blend_mode
+        ))
+    return str((shader_node_group_name, channel_signatures))
+
 def create_default_layer_node(layer_type):
+    '''Returns a new default layer node group based on shader material channels. The node group is copied from a template that's only rebuilt when the shader changes.'''
+
+    # Image layers start with the same node setup as default layers, only decal layers use a different setup.
+    if layer_type == 'DECAL':
+        template_type = 'DECAL'
+    else:
+        template_type = 'DEFAULT'
+
+    # Copying an existing node group is much faster than building the layer node setup node by node.
+    template_name = "ML_DefaultLayerTemplate_{0}".format(template_type)
+    template_signature = get_default_layer_template_signature()
+    template_node_group = bpy.data.node_groups.get(template_name)
+    if template_node_group:
+        if template_node_group.get('shader_signature') != template_signature:
+            bpy.data.node_groups.remove(template_node_group)
+            template_node_group = None
+
+    if not template_node_group:
+        template_node_group = build_default_layer_node(template_type)
+        template_node_group.name = template_name
+        template_node_group.use_fake_user = True
+        template_node_group['shader_signature'] = template_signature
+
+    # Remove template only data from the copied node group, so it isn't stored on every layer node group.
+    layer_node_group = template_node_group.copy()
+    layer_node_group.use_fake_user = False
+    if 'shader_signature' in layer_node_group:
+        del layer_node_group['shader_signature']
+    return layer_node_group
+
+def build_default_layer_node(layer_type):
     '''Creates a default setup for a layer node based on shader material channels.'''
 
     # Create a default node group for the layer, if one exists already, delete it.
@@ -767,15 +760,27 @@ def add_material_layer(layer_type, self):
 
     # Add the new layer node to the active material.
     active_material = bpy.context.active_object.active_material
-    default_layer_node_group.name = format_layer_group_node_name(active_material.name, str(new_layer_slot_index)) + "~"
+    default_layer_node_group.name = format_layer_group_node_name(active_material.name, new_layer_slot_index) + "~"
     new_layer_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
     new_layer_group_node.node_tree = default_layer_node_group
     new_layer_group_node.name = str(new_layer_slot_index) + "~"
     new_layer_group_node.label = "Layer " + str(new_layer_slot_index + 1)
     
     reindex_layer_nodes(change_made='ADDED_LAYER', affected_layer_index=new_layer_slot_index)
-    organize_layer_group_nodes()
-    link_layer_group_nodes(self)
+
+    # For image layers, toggle off all material channels excluding base color before linking, so layers are only linked once.
+    if layer_type == 'IMAGE':
+        base_color_socket_name = shaders.get_shader_channel_socket_name('BASE-COLOR')
+        shader_info = bpy.context.scene.matlayer_shader_info
+        for channel in shader_info.material_channels:
+            if channel.name != base_color_socket_name:
+                mix_node = get_material_layer_node('MIX', new_layer_slot_index, channel.name)
+                if mix_node:
+                    mix_node.mute = True
+
+    layer_count = count_layers()
+    organize_layer_group_nodes(layer_count)
+    link_layer_group_nodes(self, layer_count)
     layer_masks.organize_mask_nodes()
     layer_masks.refresh_mask_slots()
 
@@ -822,15 +827,6 @@ def add_material_layer(layer_type, self):
             debug_logging.log("Added decal layer.")
         
         case 'IMAGE':
-            # Toggle off all material channels excluding base color.
-            base_color_socket_name = shaders.get_shader_channel_socket_name('BASE-COLOR')
-            shader_info = bpy.context.scene.matlayer_shader_info
-            for channel in shader_info.material_channels:
-                if channel.name != base_color_socket_name:
-                    mix_node = get_material_layer_node('MIX', new_layer_slot_index, channel.name)
-                    if mix_node:
-                        mix_node.mute = True
-
             # Create a new blank image.
             new_image = bau.create_image(
                 new_image_name="Image",
@@ -876,7 +872,7 @@ def duplicate_layer(original_layer_index, self):
 
             new_layer_slot_index = add_material_layer_slot()
 
-            duplicated_node_tree.name = "{0}_{1}".format(active_material.name, str(new_layer_slot_index))
+            duplicated_node_tree.name = format_layer_group_node_name(active_material.name, new_layer_slot_index)
             new_layer_group_node = active_material.node_tree.nodes.new('ShaderNodeGroup')
             new_layer_group_node.node_tree = duplicated_node_tree
             new_layer_group_node.name = str(new_layer_slot_index) + "~"
@@ -886,8 +882,9 @@ def duplicate_layer(original_layer_index, self):
             new_layer_group_node.label = original_layer_node.label + " Copy"
             
             reindex_layer_nodes(change_made='ADDED_LAYER', affected_layer_index=new_layer_slot_index)
-            organize_layer_group_nodes()
-            link_layer_group_nodes(self)
+            layer_count = count_layers()
+            organize_layer_group_nodes(layer_count)
+            link_layer_group_nodes(self, layer_count)
             layer_masks.organize_mask_nodes()
 
             # Duplicate decal objects if the original layer was a decal layer.
@@ -936,8 +933,10 @@ def delete_layer(self):
     if bau.verify_material_operation_context(self) == False:
         return {'FINISHED'}
     
-    layers = bpy.context.scene.matlayer_layers
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    scene = bpy.context.scene
+    layers = scene.matlayer.layers
+    layer_stack = scene.matlayer.layer_stack
+    selected_layer_index = layer_stack.selected_layer_index
     active_material = bpy.context.active_object.active_material
 
     # For decal layers, delete the accociated empty object if one exists.
@@ -966,13 +965,15 @@ def delete_layer(self):
         active_material.node_tree.nodes.remove(layer_group_node)
 
     reindex_layer_nodes(change_made='DELETED_LAYER', affected_layer_index=selected_layer_index)
-    organize_layer_group_nodes()
-    link_layer_group_nodes(self)
-    layer_masks.organize_mask_nodes()
 
-    # Remove the layer slot and reset the selected layer index.
+    # Remove the layer slot and reset the selected layer index before organizing, so the layer slots match the remaining layer nodes.
     layers.remove(selected_layer_index)
-    bpy.context.scene.matlayer_layer_stack.selected_layer_index = max(min(selected_layer_index - 1, len(layers) - 1), 0)
+    layer_stack.selected_layer_index = max(min(selected_layer_index - 1, len(layers) - 1), 0)
+
+    layer_count = count_layers()
+    organize_layer_group_nodes(layer_count)
+    link_layer_group_nodes(self, layer_count)
+    layer_masks.organize_mask_nodes()
 
     debug_logging.log("Deleted material layer.")
 
@@ -984,9 +985,9 @@ def move_layer(direction, self):
     match direction:
         case 'UP':
             # Swap the layer index for all layer nodes in this layer with the layer above it (if one exists).
-            layers = bpy.context.scene.matlayer_layers
+            layers = bpy.context.scene.matlayer.layers
             layer_count = len(layers)
-            selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+            selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
             if selected_layer_index < layer_count:
                 layer_node = get_material_layer_node('LAYER', selected_layer_index)
                 if layer_node:
@@ -1023,15 +1024,15 @@ def move_layer(direction, self):
                     mask_node.name = layer_masks.format_mask_name(selected_layer_index + 1, i)
                     mask_node.node_tree.name = mask_node.name
 
-                bpy.context.scene.matlayer_layer_stack.selected_layer_index = selected_layer_index + 1
+                bpy.context.scene.matlayer.layer_stack.selected_layer_index = selected_layer_index + 1
 
             else:
                 debug_logging.log("Can't move layer up, no layers exist above the selected layer.")
 
         case 'DOWN':
             # Swap the layer index for all nodes in this layer with the layer below it (if one exists).
-            layers = bpy.context.scene.matlayer_layers
-            selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+            layers = bpy.context.scene.matlayer.layers
+            selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
             if selected_layer_index - 1 >= 0:
                 layer_node = get_material_layer_node('LAYER', selected_layer_index)
                 layer_node.name += "~"
@@ -1064,7 +1065,7 @@ def move_layer(direction, self):
                     mask_node.name = layer_masks.format_mask_name(selected_layer_index - 1, i)
                     mask_node.node_tree.name = mask_node.name
 
-                bpy.context.scene.matlayer_layer_stack.selected_layer_index = selected_layer_index - 1
+                bpy.context.scene.matlayer.layer_stack.selected_layer_index = selected_layer_index - 1
 
             else:
                 debug_logging.log("Can't move layer down, no layers exist below the selected layer.")
@@ -1073,21 +1074,26 @@ def move_layer(direction, self):
             debug_logging.log_status("Invalid direction provided for moving a material layer.", self, 'ERROR')
             return
 
-    organize_layer_group_nodes()
-    link_layer_group_nodes(self)
+    layer_count = count_layers()
+    organize_layer_group_nodes(layer_count)
+    link_layer_group_nodes(self, layer_count)
     layer_masks.organize_mask_nodes()
     layer_masks.refresh_mask_slots()
 
     debug_logging.log("Moved material layer.")
 
+def count_layer_nodes(material):
+    '''Counts the total layers in the specified material by reading the material's node tree.'''
+    layer_count = 0
+    while material.node_tree.nodes.get(str(layer_count)):
+        layer_count += 1
+    return layer_count
+
 def count_layers(material=None):
-    '''Counts the total layers in the specified material (active material if no material is specified) by reading the active material's node tree.'''
+    '''Counts the total layers in the specified material by reading the material's node tree. If no material is specified, the layer slots for the active material are counted instead.'''
     # Count the number of layers in the specified material.
     if material != None:
-        layer_count = 0
-        while material.node_tree.nodes.get(str(layer_count)):
-            layer_count += 1
-        return layer_count
+        return count_layer_nodes(material)
     
     # Count the active material, since no material was specified to have it's layers counted.
     else:
@@ -1099,32 +1105,44 @@ def count_layers(material=None):
         if not bpy.context.active_object.active_material:
             return 0
         
-        active_material = bpy.context.active_object.active_material
-        layer_count = 0
-        while active_material.node_tree.nodes.get(str(layer_count)):
-            layer_count += 1
+        # Layer slots are kept in sync with the layer nodes in the active material, so they can be counted without searching the node tree.
+        layer_count = len(bpy.context.scene.matlayer.layers)
+
+        # When sub operations are logged for debugging, verify the layer slots match the layer nodes in the active material.
+        addon_preferences = bpy.context.preferences.addons[preferences.ADDON_NAME].preferences
+        if addon_preferences.log_sub_operations:
+            layer_node_count = count_layer_nodes(bpy.context.active_object.active_material)
+            if layer_node_count != layer_count:
+                debug_logging.log("Layer slot count ({0}) doesn't match the layer node count ({1}) in the active material.".format(layer_count, layer_node_count), message_type='WARNING', sub_process=True)
+
         return layer_count
 
-def organize_layer_group_nodes():
-    '''Organizes all layer group nodes in the active material to ensure the node tree is easy to read.'''
+def organize_layer_group_nodes(layer_count=None):
+    '''Organizes all layer group nodes in the active material to ensure the node tree is easy to read. Pass the layer count if it's already known to avoid recounting layers.'''
     active_material = bpy.context.active_object.active_material
-    layer_count = count_layers()
+    if layer_count == None:
+        layer_count = count_layers()
 
+    nodes = active_material.node_tree.nodes
     position_x = -500
     for i in range(layer_count, 0, -1):
-        layer_group_node = active_material.node_tree.nodes.get(str(i - 1))
+        layer_group_node = nodes.get(str(i - 1))
         if layer_group_node:
-            layer_group_node.width = 300
-            layer_group_node.location = (position_x, 0)
+
+            # Only write node properties that changed, each write tags the node tree for an update.
+            if layer_group_node.width != 300:
+                layer_group_node.width = 300
+            if layer_group_node.location[0] != position_x or layer_group_node.location[1] != 0:
+                layer_group_node.location = (position_x, 0)
             position_x -= 500
     debug_logging.log("Organized layer group nodes.")
 
 def refresh_layer_stack(reason="", scene=None):
     '''Clears, and then reads the active material, to sync the number of layers in the user interface with the number of layers that exist within the material node tree.'''
     if scene:
-        layers = scene.matlayer_layers
+        layers = scene.matlayer.layers
     else:
-        layers = bpy.context.scene.matlayer_layers
+        layers = bpy.context.scene.matlayer.layers
         
     layers.clear()
 
@@ -1132,20 +1150,53 @@ def refresh_layer_stack(reason="", scene=None):
     if bpy.context.active_object != None:
 
         # Add a material slot for each material layer detected in the active material.
-        layer_count = count_layers()
+        # Layer nodes are counted directly here, since the layer slots being rebuilt can't be used to count layers.
+        layer_count = 0
+        active_material = bpy.context.active_object.active_material
+        if active_material:
+            layer_count = count_layer_nodes(active_material)
         for layer in range(0, layer_count):
             add_material_layer_slot()
 
         # Reset the layer index if it's out of range.
-        selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+        selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
         if selected_layer_index > len(layers) - 1 or selected_layer_index < 0:
-            bpy.context.scene.matlayer_layer_stack.selected_layer_index = 0
+            bpy.context.scene.matlayer.layer_stack.selected_layer_index = 0
 
     if reason != "":
         debug_logging.log("Refreshed layer stack due to: " + reason, sub_process=True)
 
-def link_layer_group_nodes(self):
-    '''Connects all layer group nodes to other existing group nodes, and the principled BSDF shader.'''
+def get_layer_channel_active(layer_node, channel_name):
+    '''Returns true if the specified material channel is toggled on (the channel's mix node exists and isn't muted) in the provided layer group node.'''
+    if layer_node == None or layer_node.node_tree == None:
+        return False
+    mix_node = layer_node.node_tree.nodes.get(format_layer_node_name('MIX', channel_name))
+    if mix_node == None or mix_node.mute:
+        return False
+    return True
+
+def get_channel_output_layer_node(channel_name, layer_nodes=None):
+    '''Returns the layer group node whose output for the specified material channel is the result of the layer stack (the top active layer with the material channel toggled on).
+    If the material channel is toggled off in all layers, the top active layer is returned. Layer nodes in the active material are read if no layer nodes (ordered bottom to top) are provided.'''
+    if layer_nodes == None:
+        active_material = bpy.context.active_object.active_material
+        layer_nodes = [active_material.node_tree.nodes.get(str(i)) for i in range(0, count_layers(active_material))]
+
+    active_layer_nodes = [layer_node for layer_node in layer_nodes if bau.get_node_active(layer_node)]
+    for layer_node in reversed(active_layer_nodes):
+        if get_layer_channel_active(layer_node, channel_name):
+            return layer_node
+
+    if len(active_layer_nodes) > 0:
+        return active_layer_nodes[-1]
+    return None
+
+def get_link_key(output_socket, input_socket):
+    '''Returns a hashable key identifying a link between the provided sockets.'''
+    return (output_socket.node.name, output_socket.identifier, input_socket.node.name, input_socket.identifier)
+
+def link_layer_group_nodes(self, layer_count=None):
+    '''Connects all layer group nodes to other existing group nodes, and the principled BSDF shader. Pass the layer count if it's already known to avoid recounting layers.'''
 
     if bau.verify_material_operation_context(self) == False:
         return
@@ -1153,84 +1204,105 @@ def link_layer_group_nodes(self):
     shader_info = bpy.context.scene.matlayer_shader_info
     active_material = bpy.context.active_object.active_material
     node_tree = active_material.node_tree
+    nodes = node_tree.nodes
+    links = node_tree.links
 
     # Don't attempt to link layer group nodes if there are no layers.
-    layer_count = count_layers()
+    if layer_count == None:
+        layer_count = count_layers()
     if layer_count <= 0:
         return
 
-    # Disconnect all layer group nodes (don't disconnect masks).
-    for i in range(0, layer_count):
-        layer_node = get_material_layer_node('LAYER', i)
-        if layer_node:
-            for input in layer_node.inputs:
-                if input.name != 'Layer Mask':
-                    for link in input.links:
-                        node_tree.links.remove(link)
-            for output in layer_node.outputs:
-                for link in output.links:
-                    node_tree.links.remove(link)
+    # Read layer group nodes and material channel names once, rather than re-resolving them through the active context for every link.
+    # Material channels are defined by the shader, so the channels to link are read into tables here instead of being hard-coded.
+    # Layer slots can be out of sync with the node tree (i.e. after layer nodes are deleted manually), so layer nodes that don't exist are skipped.
+    layer_nodes = [nodes.get(str(i)) for i in range(0, layer_count)]
+    layer_nodes = [layer_node for layer_node in layer_nodes if layer_node]
+    channel_names = tuple(channel.name for channel in shader_info.material_channels)
+
+    # Only active material channels are connected to the shader node.
+    shader_channel_names = tuple(channel_name for channel_name in channel_names if tss.get_material_channel_active(channel_name))
 
     # Re-connect all (non-muted / active) layer group nodes.
-    for i in range(0, layer_count):
-        layer_node = get_material_layer_node('LAYER', i)
-        if bau.get_node_active(layer_node):
-            next_layer_index = i + 1
-            next_layer_node = get_material_layer_node('LAYER', next_layer_index)
-            if next_layer_node:
-                while not bau.get_node_active(next_layer_node) and next_layer_index <= layer_count - 1:
-                    next_layer_index += 1
-                    next_layer_node = get_material_layer_node('LAYER', next_layer_index)
-
-            if next_layer_node:
-                if bau.get_node_active(next_layer_node):
-                    for channel in shader_info.material_channels:
-
-                        # Optimization disabled.
-                        # This causes issues with layer transparency changes not triggering updates in an optimized fashion.
-                        # If the next layers material channel is blending using the 'mix' blending method,
-                        # and the next layer has no mask applied, this layers material channel values will have no
-                        # effect on the material output. We can skip linking these channels so shaders will compile much faster.
-                        '''
-                        mask_node = layer_masks.get_mask_node('MASK', next_layer_index, 0)
-                        if not mask_node:
-                            next_layer_mix_node = get_material_layer_node('MIX', next_layer_index, channel.name)
-                            if next_layer_mix_node:
-                                if next_layer_mix_node.bl_static_type == 'MIX' and next_layer_mix_node.blend_type == 'MIX':
-                                    next_layer_opacity_node = get_material_layer_node('OPACITY', next_layer_index, channel.name)
-                                    if next_layer_opacity_node:
-                                        if next_layer_opacity_node.inputs[0].default_value == 1:
-                                            continue
-                        '''
-
-                        output_socket = layer_node.outputs.get(channel.name)
-                        input_socket = next_layer_node.inputs.get(channel.name)
-                        if output_socket and input_socket:
-                            node_tree.links.new(output_socket, input_socket)
-
-    # Connect the last (non-muted / active) layer node to the principled BSDF.
-    shader_node = active_material.node_tree.nodes.get('MATLAYER_SHADER')
-
-    last_layer_node_index = layer_count - 1
-    last_layer_node = get_material_layer_node('LAYER', last_layer_node_index)
-    if last_layer_node:
-        while not bau.get_node_active(last_layer_node) and last_layer_node_index >= 0:
-            last_layer_node = get_material_layer_node('LAYER', last_layer_node_index)
-            last_layer_node_index -= 1
-
-    if last_layer_node:
-        if bau.get_node_active(last_layer_node):
-            
-            for channel in shader_info.material_channels:
+    # Links between layers are collected first and created in a single pass after all sockets are resolved.
+    active_layer_nodes = [layer_node for layer_node in layer_nodes if bau.get_node_active(layer_node)]
+    shader_node = nodes.get('MATLAYER_SHADER')
+    layer_links = []
+    shader_links = []
+    for channel_name in channel_names:
+        previous_output_socket = None
+        for layer_node in active_layer_nodes:
+
+            # Layers with the material channel toggled off (muted mix node) pass the channel through unchanged.
+            # Skip linking the material channel for these layers so their nodes for the channel are not compiled into the shader.
+            if not get_layer_channel_active(layer_node, channel_name):
+                continue
+
+            # Optimization disabled.
+            # This causes issues with layer transparency changes not triggering updates in an optimized fashion.
+            # If the next layers material channel is blending using the 'mix' blending method,
+            # and the next layer has no mask applied, this layers material channel values will have no
+            # effect on the material output. We can skip linking these channels so shaders will compile much faster.
+            '''
+            mask_node = layer_masks.get_mask_node('MASK', next_layer_index, 0)
+            if not mask_node:
+                next_layer_mix_node = get_material_layer_node('MIX', next_layer_index, channel_name)
+                if next_layer_mix_node:
+                    if next_layer_mix_node.bl_static_type == 'MIX' and next_layer_mix_node.blend_type == 'MIX':
+                        next_layer_opacity_node = get_material_layer_node('OPACITY', next_layer_index, channel_name)
+                        if next_layer_opacity_node:
+                            if next_layer_opacity_node.inputs[0].default_value == 1:
+                                continue
+            '''
+
+            output_socket = layer_node.outputs.get(channel_name)
+            input_socket = layer_node.inputs.get(channel_name)
+            if not output_socket or not input_socket:
+                continue
+
+            if previous_output_socket:
+                layer_links.append((previous_output_socket, input_socket))
+            previous_output_socket = output_socket
+
+        # Connect the last (non-muted / active) layer node with the material channel toggled on to the principled BSDF.
+        if channel_name in shader_channel_names:
+            output_layer_node = get_channel_output_layer_node(channel_name, active_layer_nodes)
+            if output_layer_node:
+                output_socket = output_layer_node.outputs.get(channel_name)
+                input_socket = shader_node.inputs.get(channel_name)
+                if output_socket and input_socket:
+                    shader_links.append((output_socket, input_socket))
+
+    # Read the existing links for all layer group nodes (excluding masks).
+    existing_links = []
+    for layer_node in layer_nodes:
+        for input in layer_node.inputs:
+            if input.name != 'Layer Mask':
+                existing_links.extend(input.links)
+        for output in layer_node.outputs:
+            existing_links.extend(output.links)
+
+    # Links between two layers are read from both layers, so existing links are keyed to keep one reference per link.
+    # All keys are read before any link is removed, since removing a link leaves other references to it pointing to freed memory.
+    existing_links_by_key = {get_link_key(link.from_socket, link.to_socket): link for link in existing_links}
+
+    # Every change to the node tree triggers the material shader to re-compile.
+    # Skip editing the node tree when the layer group nodes are already linked correctly (i.e. after adding or editing masks).
+    required_link_keys = set(get_link_key(output_socket, input_socket) for output_socket, input_socket in layer_links + shader_links)
+    if set(existing_links_by_key) == required_link_keys:
+        debug_logging.log("Layer group nodes are already linked.")
+        return
 
-                # Only connect active material channels.
-                if not tss.get_material_channel_active(channel.name):
-                    continue
+    # Disconnect all layer group nodes (don't disconnect masks).
+    for link in existing_links_by_key.values():
+        links.remove(link)
 
-                output_socket = last_layer_node.outputs.get(channel.name)
-                input_socket = shader_node.inputs.get(channel.name)
-                if output_socket and input_socket:
-                    node_tree.links.new(output_socket, input_socket)
+    # All layer inputs (excluding masks) were disconnected above, so link limit verification can be skipped for links between layers.
+    for output_socket, input_socket in layer_links:
+        links.new(output_socket, input_socket, verify_limits=False)
+
+    for output_socket, input_socket in shader_links:
+        links.new(output_socket, input_socket)
     
     debug_logging.log("Linked layer group nodes.")
 
@@ -1239,7 +1311,7 @@ def reindex_layer_nodes(change_made, affected_layer_index):
     match change_made:
         case 'ADDED_LAYER':
             # Increase the layer index for all layer group nodes, their node trees, and their masks that exist above the affected layer.
-            layer_count = len(bpy.context.scene.matlayer_layers)
+            layer_count = len(bpy.context.scene.matlayer.layers)
             for i in range(layer_count, affected_layer_index, -1):
                 layer_node = get_material_layer_node('LAYER', i - 1)
                 if layer_node:
@@ -1262,13 +1334,15 @@ def reindex_layer_nodes(change_made, affected_layer_index):
 
         case 'DELETED_LAYER':
             # Reduce the layer index for all layer group nodes, their nodes trees, and their masks that exist above the affected layer.
-            layer_count = len(bpy.context.scene.matlayer_layers)
+            # Layer node names match their slot index, so each layer above the deleted layer is shifted down in a single pass.
+            layer_count = len(bpy.context.scene.matlayer.layers)
             for i in range(affected_layer_index + 1, layer_count):
                 layer_node = get_material_layer_node('LAYER', i)
-                layer_node.name = str(int(layer_node.name) - 1)
+                if not layer_node:
+                    continue
+                layer_node.name = str(i - 1)
                 material_name = parse_material_name(layer_node.node_tree.name)
-                layer_index = parse_layer_index(layer_node.node_tree.name)
-                layer_node.node_tree.name = format_layer_group_node_name(material_name, layer_index - 1)
+                layer_node.node_tree.name = format_layer_group_node_name(material_name, i - 1)
                 layer_mask_count = layer_masks.count_masks(i)
                 for c in range(0, layer_mask_count):
                     mask_node = layer_masks.get_mask_node('MASK', i, c)
@@ -1281,7 +1355,7 @@ def reindex_layer_nodes(change_made, affected_layer_index):
 def apply_mesh_maps():
     '''Searches for all mesh map texture nodes in the node tree and applies mesh maps if they exist.'''
     # Apply baked mesh maps to all group nodes used as masks for all material layers.
-    layers = bpy.context.scene.matlayer_layers
+    layers = bpy.context.scene.matlayer.layers
     for layer_index in range(0, len(layers)):
         mask_count = layer_masks.count_masks(layer_index)
         for mask_index in range(0, mask_count):
@@ -1296,7 +1370,7 @@ def apply_mesh_maps():
 
 def relink_material_channel(relink_material_channel_name="", original_output_channel='', unlink_projection=False):
     '''Relinks projection nodes to material channels based on the current projection node tree being used.'''
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     layer_node_tree = get_layer_node_tree(selected_layer_index)
     projection_node = get_material_layer_node('PROJECTION', selected_layer_index)
     
@@ -1360,7 +1434,7 @@ def relink_material_channel(relink_material_channel_name="", original_output_cha
 
 def set_layer_projection_nodes(projection_method):
     '''Changes the layer projection nodes to use the specified layer projection method.'''
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     projection_node = get_material_layer_node('PROJECTION', selected_layer_index)
     
     match projection_method:
@@ -1372,7 +1446,7 @@ def set_layer_projection_nodes(projection_method):
 
 def delete_triplanar_blending_nodes(material_channel_name):
     '''Deletes nodes used for triplanar texture sampling and blending for the specified material channel.'''
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     layer_node_tree = get_layer_node_tree(selected_layer_index)
 
     for i in range(0, 3):
@@ -1386,7 +1460,7 @@ def delete_triplanar_blending_nodes(material_channel_name):
 
 def setup_material_channel_projection_nodes(material_channel_name, projection_method, set_texture_node=False):
     '''Replaces the projection node setup for the specified material channel based on the projection method.'''
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     layer_node_tree = get_layer_node_tree(selected_layer_index)
     value_node = get_material_layer_node('VALUE', selected_layer_index, material_channel_name, 1)
     node_channel_name = bau.format_static_channel_name(material_channel_name)
@@ -1508,7 +1582,7 @@ def setup_material_channel_projection_nodes(material_channel_name, projection_me
 
 def replace_material_channel_node(channel_name, node_type):
     '''Replaces the existing material channel node with a new node of the given type. Valid node types include: 'GROUP', 'TEXTURE'.'''
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     layer_group_node = get_layer_node_tree(selected_layer_index)
     projection_node = get_material_layer_node('PROJECTION', selected_layer_index)
     value_node = get_material_layer_node('VALUE', selected_layer_index, channel_name)
@@ -1569,7 +1643,7 @@ def set_layer_projection(projection_mode, self):
     if bau.verify_material_operation_context(self) == False:
         return
 
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     projection_node = get_material_layer_node('PROJECTION', selected_layer_index)
     if not projection_node:
         debug_logging.log_status("Error, missing layer projection node. The material node format is corrupt, or the active material is not made with this add-on.")
@@ -1598,7 +1672,7 @@ def set_layer_projection(projection_mode, self):
 
 def get_material_channel_crgba_output(material_channel_name):
     '''Returns which Color / RGBA channel output is used for the specified material channel.'''
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     filter_node = get_material_layer_node('FILTER', selected_layer_index, material_channel_name)
 
     output_channel = ''
@@ -1639,7 +1713,7 @@ def get_material_channel_crgba_output(material_channel_name):
 def set_material_channel_crgba_output(material_channel_name, output_channel_name, layer_index=-1):
     '''Links the specified Color / RGBA output channel for the specified material channel.'''
     if layer_index == -1:
-        layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+        layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
 
     layer_node_tree = get_layer_node_tree(layer_index)
     separate_color_node = get_material_layer_node('SEPARATE_RGBA', layer_index, material_channel_name)
@@ -1747,14 +1821,11 @@ def isolate_material_channel(material_channel_name):
     # Unlink the emission node to ensure nothing else is connected to it.
     bau.unlink_node(emission_node, active_node_tree, unlink_inputs=True, unlink_outputs=True)
 
-    # For all other material channels connect the specified material channel for the last active material channel.
+    # Connect the specified material channel output from the layer that outputs the layer stack result for the material channel.
     output_socket_name = shaders.get_shader_channel_socket_name(material_channel_name)
-    total_layers = count_layers(bpy.context.active_object.active_material)
-    for i in range(total_layers, 0, -1):
-        layer_node = get_material_layer_node('LAYER', i - 1)
-        if bau.get_node_active(layer_node):
-            bau.safe_node_link(layer_node.outputs.get(output_socket_name), emission_node.inputs[0], active_node_tree)
-            break
+    output_layer_node = get_channel_output_layer_node(output_socket_name)
+    if output_layer_node:
+        bau.safe_node_link(output_layer_node.outputs.get(output_socket_name), emission_node.inputs[0], active_node_tree)
     
     active_node_tree.links.new(emission_node.outputs[0], material_output.inputs[0])
 
@@ -1776,7 +1847,7 @@ def show_layer():
                     active_node_tree.links.new(principled_bsdf.outputs[0], material_output.inputs[0])
 
 def toggle_image_alpha_blending(material_channel_name):
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     image_alpha_node = get_material_layer_node('MIX_IMAGE_ALPHA', selected_layer_index, material_channel_name)
     if image_alpha_node.mute:
         image_alpha_node.mute = False
@@ -1787,7 +1858,7 @@ def get_layer_blending_mode(layer_index, material_channel_name=''):
     '''Returns the current blending mode for the layer at the specified index.'''
     # If there is no specified material channel, use the current selected on from the layer stack.
     if material_channel_name == '':
-        material_channel_name = bpy.context.scene.matlayer_layer_stack.selected_material_channel
+        material_channel_name = bpy.context.scene.matlayer.layer_stack.selected_material_channel
 
     mix_node = get_material_layer_node('MIX', layer_index, material_channel_name)
     match mix_node.bl_static_type:
@@ -1871,6 +1942,7 @@ class MATLAYER_layer_stack(PropertyGroup):
     '''Properties for the layer stack.'''
     selected_layer_index: IntProperty(default=-1, description="Selected material layer", update=update_layer_index)
     selected_material_channel: StringProperty(name="Material Channel", description="The currently selected material channel", default='ERROR')
+    next_slot_id: IntProperty(default=0, description="Unique id assigned to the next material layer slot added to the layer stack")
 
 class MATLAYER_layers(PropertyGroup):
     # Storing properties in the layer slot data can potentially cause many errors and often more code -
@@ -1880,6 +1952,11 @@ class MATLAYER_layers(PropertyGroup):
     # A placeholder property is kept here so the UI still has a property group to reference to draw the UIList.
     placeholder_property: IntProperty()
 
+class MATLAYER_scene_layer_properties(PropertyGroup):
+    '''Layer properties stored on the scene. Grouping these under one pointer property keeps add-on layer data one lookup away from the scene.'''
+    layers: CollectionProperty(type=MATLAYER_layers)
+    layer_stack: PointerProperty(type=MATLAYER_layer_stack)
+
 class MATLAYER_OT_add_material_layer(Operator):
     bl_idname = "matlayer.add_material_layer"
     bl_label = "Add Material Layer"
@@ -1937,7 +2014,7 @@ class MATLAYER_OT_duplicate_layer(Operator):
         return context.active_object
 
     def execute(self, context):
-        selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+        selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
         duplicate_layer(selected_layer_index, self)
         return {'FINISHED'}
 
@@ -1953,6 +2030,11 @@ class MATLAYER_OT_delete_layer(Operator):
         return context.active_object
 
     def execute(self, context):
+        # Cancel when the selected layer index doesn't point to a layer slot so no undo step is pushed for a no-op.
+        selected_layer_index = context.scene.matlayer.layer_stack.selected_layer_index
+        if selected_layer_index < 0 or selected_layer_index >= len(context.scene.matlayer.layers):
+            return {'CANCELLED'}
+
         delete_layer(self)
         return {'FINISHED'}
 
@@ -2030,6 +2112,27 @@ class MATLAYER_OT_toggle_hide_layer(Operator):
         link_layer_group_nodes(self)
         return {'FINISHED'}
 
+class MATLAYER_OT_toggle_layer_material_channel(Operator):
+    bl_idname = "matlayer.toggle_layer_material_channel"
+    bl_label = "Toggle Layer Material Channel"
+    bl_description = "Toggles the material channel on / off for the selected layer by muting / unmuting the material channel mix node and triggering a relink of group nodes"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    material_channel_name: StringProperty(default='COLOR')
+
+    # Disable when there is no active object.
+    @ classmethod
+    def poll(cls, context):
+        return context.active_object
+
+    def execute(self, context):
+        selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
+        mix_node = get_material_layer_node('MIX', selected_layer_index, self.material_channel_name)
+        if mix_node:
+            mix_node.mute = not mix_node.mute
+            link_layer_group_nodes(self)
+        return {'FINISHED'}
+
 class MATLAYER_OT_set_layer_projection_uv(Operator):
     bl_idname = "matlayer.set_layer_projection_uv"
     bl_label = "Set Layer Projection UV"
@@ -2094,7 +2197,7 @@ class MATLAYER_OT_toggle_triplanar_flip_correction(Operator):
 
     def execute(self, context):
         # Mute / unmute nodes that correct triplanar projection axis flipping.
-        selected_layer_index = context.scene.matlayer_layer_stack.selected_layer_index
+        selected_layer_index = context.scene.matlayer.layer_stack.selected_layer_index
         projection_node = get_material_layer_node('PROJECTION', selected_layer_index)
         if projection_node:
             if projection_node.node_tree.name == 'ML_TriplanarProjection':
@@ -2119,7 +2222,7 @@ class MATLAYER_OT_isolate_material_channel(Operator):
         return context.active_object
 
     def execute(self, context):
-        selected_material_channel = bpy.context.scene.matlayer_layer_stack.selected_material_channel
+        selected_material_channel = bpy.context.scene.matlayer.layer_stack.selected_material_channel
         isolate_material_channel(selected_material_channel)
         return {'FINISHED'}
 
@@ -2152,7 +2255,7 @@ class MATLAYER_OT_toggle_material_channel_filter(Operator):
         return context.active_object
 
     def execute(self, context):
-        selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+        selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
         filter_node = get_material_layer_node('FILTER', selected_layer_index, self.material_channel_name)
 
         output_channel = get_material_channel_crgba_output(self.material_channel_name)
@@ -2177,7 +2280,7 @@ class MATLAYER_OT_set_material_channel(Operator):
     channel_name: StringProperty(default="ERROR")
 
     def execute(self, context):
-        bpy.context.scene.matlayer_layer_stack.selected_material_channel = self.channel_name
+        bpy.context.scene.matlayer.layer_stack.selected_material_channel = self.channel_name
         debug_logging.log("Selected material channel set to: {0}".format(self.channel_name))
         return {'FINISHED'}
 
@@ -2212,7 +2315,7 @@ class MATLAYER_OT_set_layer_blending_mode(Operator):
         return context.active_object
 
     def execute(self, context):
-        material_channel = bpy.context.scene.matlayer_layer_stack.selected_material_channel
+        material_channel = bpy.context.scene.matlayer.layer_stack.selected_material_channel
         set_layer_blending_mode(self.layer_index, self.blending_mode, material_channel)
         link_layer_group_nodes(self)
         return {'FINISHED'}
@@ -184,7 +184,7 @@ def set_shader(shader_name):
 
     # Set the default channel of the shader to be the first defined channel.
     if len(shader_info.material_channels) > 0:
-        bpy.context.scene.matlayer_layer_stack.selected_material_channel = shader_info.material_channels[0].name
+        bpy.context.scene.matlayer.layer_stack.selected_material_channel = shader_info.material_channels[0].name
 
 def read_json_shader_data():
     '''Reads json shader data. Creates a json file if one does not exist.'''
@@ -73,7 +73,7 @@ def on_active_material_index_changed():
 
             if active_object.active_material:
                 if active_object.active_material.name != bpy.types.Scene.previous_active_material_name:
-                    bpy.context.scene.matlayer_layer_stack.selected_layer_index = 0
+                    bpy.context.scene.matlayer.layer_stack.selected_layer_index = 0
                     material_layers.refresh_layer_stack()
                     sub_to_active_material_index(active_object)
                     sub_to_active_material_name(active_object)
@@ -82,7 +82,7 @@ def on_active_material_index_changed():
     
             else:
                 if bpy.types.Scene.previous_active_material_name != "":
-                    bpy.context.scene.matlayer_layer_stack.selected_layer_index = 0
+                    bpy.context.scene.matlayer.layer_stack.selected_layer_index = 0
                     material_layers.refresh_layer_stack()
                     sub_to_active_material_index(active_object)
                     sub_to_active_material_name(active_object)
@@ -99,7 +99,7 @@ def on_active_material_name_changed():
 
         # Rename all layer group nodes related to the renamed material.
         for i in range(0, layer_count):
-            layer_node_tree = bpy.data.node_groups.get("{0}_{1}".format(previous_material_name, i))
+            layer_node_tree = bpy.data.node_groups.get(material_layers.format_layer_group_node_name(previous_material_name, i))
             if layer_node_tree:
                 layer_node_tree.name = material_layers.format_layer_group_node_name(active_material.name, i)
 
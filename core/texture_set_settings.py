@@ -147,19 +147,16 @@ class MATLAYER_OT_toggle_texture_set_material_channel(Operator):
             if channel_toggle_node.mute:
                 channel_toggle_node.mute = False
 
-                # Connect the last active layer node for the toggled material channel to the principled bsdf.
-                total_layers = material_layers.count_layers(active_material)
-                for i in range(total_layers, 0, -1):
-                    layer_node = material_layers.get_material_layer_node('LAYER', i - 1)
-                    if bau.get_node_active(layer_node):
-                        channel_name = self.material_channel_name
-                        shader_node = active_material.node_tree.nodes.get('MATLAYER_SHADER')
-                        bau.safe_node_link(
-                            layer_node.outputs.get(channel_name),
-                            shader_node.inputs.get(channel_name),
-                            active_material.node_tree
-                        )
-                        break
+                # Connect the layer that outputs the layer stack result for the toggled material channel to the principled bsdf.
+                channel_name = self.material_channel_name
+                layer_node = material_layers.get_channel_output_layer_node(channel_name)
+                if layer_node:
+                    shader_node = active_material.node_tree.nodes.get('MATLAYER_SHADER')
+                    bau.safe_node_link(
+                        layer_node.outputs.get(channel_name),
+                        shader_node.inputs.get(channel_name),
+                        active_material.node_tree
+                    )
 
                 # Toggle on alpha clip to allow transparency.
                 if self.material_channel_name == 'ALPHA':
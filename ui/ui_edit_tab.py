@@ -75,7 +75,8 @@ def draw_layers_tab_ui(self, context):
         return
 
     # Draw layer user interface.
-    layer_count = material_layers.count_layers()
+    # Layer slots are read directly, the user interface is redrawn often and doesn't need layer count verification.
+    layer_count = len(bpy.context.scene.matlayer.layers)
     if layer_count > 0:
         draw_material_property_tabs(column_one)
         match bpy.context.scene.matlayer_material_property_tabs:
@@ -120,7 +121,7 @@ def draw_material_selector(layout):
         second_column = split.column(align=True)
         second_column.scale_x = 0.1
 
-        first_column.template_list("MATERIAL_UL_matslots", "Layers", bpy.context.active_object, "material_slots", bpy.context.active_object, "active_material_index")
+        first_column.template_list("MATERIAL_UL_matslots", "Layers", active_object, "material_slots", active_object, "active_material_index")
         second_column.operator("matlayer.add_material_slot", text="", icon='ADD')
         second_column.operator("matlayer.remove_material_slot", text="-")
         second_column.operator("matlayer.move_material_slot_up", text="", icon='TRIA_UP')
@@ -128,7 +129,7 @@ def draw_material_selector(layout):
         second_column.operator("object.material_slot_assign", text="", icon='MATERIAL_DATA')
         second_column.operator("object.material_slot_select", text="", icon='SELECT_SET')
 
-        layout.prop(bpy.context.active_object, "active_material", text="")
+        layout.prop(active_object, "active_material", text="")
         
         # TODO: Deprecate this if drag 'n drop material merging is implemented.
         '''
@@ -149,7 +150,7 @@ def draw_selected_material_channel(layout):
     row = layout.row(align=True)
     row.scale_x = 2
     row.scale_y = 1.4
-    selected_material_channel = bpy.context.scene.matlayer_layer_stack.selected_material_channel
+    selected_material_channel = bpy.context.scene.matlayer.layer_stack.selected_material_channel
     row.menu("MATLAYER_MT_material_channel_sub_menu", text=selected_material_channel)
     row.operator("matlayer.isolate_material_channel", text="", icon='MATERIAL')
 
@@ -168,8 +169,12 @@ def draw_layer_operations(layout):
 
 def draw_layer_stack(layout):
     '''Draws the material layer stack along with it's operators and material channel.'''
+    layer_properties = bpy.context.scene.matlayer
+    layer_stack = layer_properties.layer_stack
+
+    # Layer slots are stored bottom to top so their indices match the layer node indices in the material, they're displayed in reverse so the top layer is drawn first.
     row = layout.row(align=True)
-    row.template_list("MATLAYER_UL_layer_list", "Layers", bpy.context.scene, "matlayer_layers", bpy.context.scene.matlayer_layer_stack, "selected_layer_index", sort_reverse=True)
+    row.template_list("MATLAYER_UL_layer_list", "Layers", layer_properties, "layers", layer_stack, "selected_layer_index", sort_reverse=True)
     row.scale_y = 2
 
 def draw_selected_image_name(layout):
@@ -188,7 +193,7 @@ def draw_material_property_tabs(layout):
 
 def draw_layer_material_channel_toggles(layout):
     '''Draws on / off toggles with for individual material channels in the selected material layer.'''
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
 
     row = layout.row()
     row.separator()
@@ -212,7 +217,9 @@ def draw_layer_material_channel_toggles(layout):
         if mix_node:
 
             # Draw material channels with shortened names so they are more condensed in the user interface.
-            row.prop(mix_node, "mute", text=material_layers.get_shorthand_material_channel_name(channel_name), toggle=True, invert_checkbox=True)
+            # Material channels are toggled with an operator so layer group nodes are relinked when a channel is toggled.
+            operator = row.operator("matlayer.toggle_layer_material_channel", text=material_layers.get_shorthand_material_channel_name(channel_name), depress=not mix_node.mute)
+            operator.material_channel_name = channel_name
             drawn_toggles += 1
             if len(active_material_channels) > 5:
                 if drawn_toggles >= min(4, round(len(active_material_channels) / 2)):
@@ -339,7 +346,7 @@ def draw_value_node_properties(layout, value_node):
 
 def draw_material_channel_properties(layout):
     '''Draws properties for all active material channels on selected material layer.'''
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
 
     # Avoid drawing material channel properties for invalid layers.
     if material_layers.get_material_layer_node('LAYER', selected_layer_index) == None:
@@ -370,7 +377,7 @@ def draw_material_channel_properties(layout):
 
 def draw_layer_projection(layout):
     '''Draws layer projection settings.'''
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     
     # Draw the projection mode.
     projection_node = material_layers.get_material_layer_node('PROJECTION', selected_layer_index)
@@ -463,7 +470,7 @@ def draw_mask_projection(layout):
     row.scale_y = 2.5
     row.separator()
 
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     selected_mask_index = bpy.context.scene.matlayer_mask_stack.selected_index
     mask_projection_node = layer_masks.get_mask_node('PROJECTION', selected_layer_index, selected_mask_index)
     mask_id_name = layer_masks.get_mask_id_name(selected_layer_index, selected_mask_index)
@@ -669,7 +676,7 @@ def draw_masks(layout):
     row.scale_y = 2
 
     # Draw properties for the selected mask.
-    selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+    selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
     selected_mask_index = bpy.context.scene.matlayer_mask_stack.selected_index
     mask_node = layer_masks.get_mask_node('MASK', selected_layer_index, selected_mask_index)
     if mask_node:
@@ -766,7 +773,7 @@ class MATLAYER_OT_add_layer_mask_menu(Operator):
         col.operator("matlayer.add_linear_gradient_mask", text="Linear Gradient")
 
         row = layout.row(align=True)
-        selected_layer_index = bpy.context.scene.matlayer_layer_stack.selected_layer_index
+        selected_layer_index = bpy.context.scene.matlayer.layer_stack.selected_layer_index
         layer_projection_node = material_layers.get_material_layer_node('PROJECTION', selected_layer_index)
         if layer_projection_node:
             if layer_projection_node.node_tree.name != 'ML_DecalProjection':
@@ -102,12 +102,15 @@ class MATLAYER_UL_layer_list(bpy.types.UIList):
     '''Draws the layer stack.'''
 
     def draw_item(self, context, layout, data, item, icon, active_data, index):
-        self.use_filter_show = False
-        self.use_filter_reverse = True
+        # Only write list display settings when they differ, this is called for every drawn layer.
+        if self.use_filter_show:
+            self.use_filter_show = False
+        if not self.use_filter_reverse:
+            self.use_filter_reverse = True
 
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
-            layers = bpy.context.scene.matlayer_layers
-            item_index = layers.find(item.name)
+            # The index provided to draw_item is the index of the layer slot in the layer collection, so searching the collection for the item isn't required.
+            item_index = index
             layer_node = material_layers.get_material_layer_node('LAYER', item_index)
 
             if layer_node:
@@ -129,7 +132,7 @@ class MATLAYER_UL_layer_list(bpy.types.UIList):
                 row.prop(layer_node, "label", text="", emboss=False)
 
                 # Layer opacity and blending mode (for the selected material channel).
-                selected_material_channel = bpy.context.scene.matlayer_layer_stack.selected_material_channel
+                selected_material_channel = active_data.selected_material_channel
                 opacity_layer_node = material_layers.get_material_layer_node('OPACITY', item_index, channel_name=selected_material_channel.upper())
                 mix_layer_node = material_layers.get_material_layer_node('MIX', item_index, channel_name=selected_material_channel.upper())
                 if mix_layer_node: